@@ -27,7 +27,7 @@ class ChangeDetection(object):
     def __init__(self, table_paths, root_folder, hash_table=hash_table):
         self.hash_table = hash_table
         if not arcpy.Exists(hash_table):
-            log.info(f'creating change detection table: {hash_table}')
+            log.info('creating change detection table: %s', hash_table)
             arcpy.management.CreateTable(path.dirname(hash_table), path.basename(hash_table))
             arcpy.management.AddField(hash_table, table_name_field, 'TEXT')
             arcpy.management.AddField(hash_table, hash_field, 'TEXT')
@@ -67,7 +67,7 @@ class ChangeDetection(object):
         elif crate.result[0] == Crate.CREATED:
             status = Crate.CREATED
 
-        log.info(f'truncating {crate.destination}')
+        log.info('truncating %s', crate.destination)
         arcpy.management.TruncateTable(crate.destination)
 
         with arcpy.EnvManager(geographicTransformations=crate.geographic_transformation):
@@ -77,10 +77,10 @@ class ChangeDetection(object):
         with arcpy.da.UpdateCursor(self.hash_table, [hash_field], where_clause=f'{table_name_field} = \'{table_name}\'') as cursor:
             try:
                 next(cursor)
-                log.info(f'updating value in hash table for {table_name}')
+                log.info('updating value in hash table for %s', table_name)
                 cursor.updateRow((self.current_hashes[table_name],))
             except StopIteration:
-                log.info(f'adding new row in hash table for {table_name}')
+                log.info('adding new row in hash table for %s', table_name)
                 with arcpy.da.InsertCursor(self.hash_table, [table_name_field, hash_field]) as insert_cursor:
                     insert_cursor.insertRow((table_name, self.current_hashes[table_name]))
 
@@ -96,7 +96,7 @@ def _get_hashes(table_paths):
     data = {}
 
     for table_path in table_paths:
-        log.info(f'getting change detection data from: {table_path}')
+        log.info('getting change detection data from: %s', table_path)
         with arcpy.da.SearchCursor(table_path, ['table_name', 'hash']) as cursor:
             for table_name, hash_value in cursor:
                 if table_name in data:
@@ -7,14 +7,18 @@ A module that contains logic for reading and writing the config file
 '''
 
 import logging
-from json import dumps, loads
-from os import makedirs
+from copy import deepcopy
+from json import dump, loads
+from os import makedirs, stat
 from os.path import abspath, dirname, exists, join
 
 log = logging.getLogger('forklift')
 config_location = join(abspath(dirname(__file__)), '..', 'forklift-garage', 'config.json')
 default_warehouse_location = 'c:\\forklift\\warehouse'
 
+#: the parsed config file keyed by its location and modified time
+_cache = {'location': None, 'mtime': None, 'data': None}
+
 
 def create_default_config():
     '''stubs out a config file with default values
@@ -54,9 +58,11 @@ def create_default_config():
             'warehouse': default_warehouse_location
         }
 
-        json_config_file.write(dumps(data, sort_keys=True, indent=2, separators=(',', ': ')))
+        dump(data, json_config_file, sort_keys=True, indent=2, separators=(',', ': '))
+
+    clear_config_cache()
 
-        return abspath(json_config_file.name)
+    return abspath(json_config_file.name)
 
 
 def _get_config():
@@ -66,8 +72,25 @@ def _get_config():
     if not exists(config_location):
         create_default_config()
 
-    with open(config_location, 'r') as json_config_file:
-        return loads(json_config_file.read())
+    mtime = stat(config_location).st_mtime_ns
+    if _cache['location'] != config_location or _cache['mtime'] != mtime:
+        #: read the raw bytes in one call and let json detect the encoding, skipping the text decoding layer
+        with open(config_location, 'rb') as json_config_file:
+            _cache['data'] = loads(json_config_file.read())
+
+        _cache['location'] = config_location
+        _cache['mtime'] = mtime
+
+    #: hand out a copy so callers can't mutate the cached config
+    return deepcopy(_cache['data'])
+
+
+def clear_config_cache():
+    '''forces the next read of the config to come from the file
+    '''
+    _cache['location'] = None
+    _cache['mtime'] = None
+    _cache['data'] = None
 
 
 def get_config_prop(key):
@@ -114,9 +137,27 @@ def set_config_prop(key, value, override=False):
                 else:
                     return '{} already contains {}'.format(key, value)
             else:
-                for item in value:
-                    if item not in config[key]:
-                        config[key].append(item)
+                existing = config[key]
+                new_items = []
+                try:
+                    #: use a set so merging long lists is not quadratic
+                    seen = set(existing)
+                    for item in value:
+                        if item not in seen:
+                            seen.add(item)
+                            new_items.append(item)
+                except TypeError:
+                    #: unhashable items (e.g. repository objects) fall back to list membership
+                    new_items = []
+                    for item in value:
+                        if item not in existing and item not in new_items:
+                            new_items.append(item)
+
+                #: nothing new so don't rewrite the file
+                if len(new_items) == 0:
+                    return '{} already contains {}'.format(key, value)
+
+                existing.extend(new_items)
         except AttributeError:
             #: prop is not an array set value instead of append
             config[key] = value
@@ -124,6 +165,8 @@ def set_config_prop(key, value, override=False):
         config[key] = value
 
     with open(config_location, 'w') as json_config_file:
-        json_config_file.write(dumps(config, sort_keys=True, indent=2, separators=(',', ': ')))
+        dump(config, json_config_file, sort_keys=True, indent=2, separators=(',', ': '))
+
+    clear_config_cache()
 
     return 'Added {} to {}'.format(value, key)
@@ -34,6 +34,18 @@ scratch_gdb_path = path.join(garage, _scratch_gdb)
 
 shape_field_index = -2
 
+#: the most hashes that are deleted with a where clause. stays under Oracle's limit of 1000 IN list items
+delete_batch_size = 999
+
+#: global id's do not export to file geodatabase
+_skip_fields = frozenset(['global_id', 'globalid'])
+
+#: describe properties that name managed fields
+_skip_field_props = ('shapeFieldName', 'lengthFieldName', 'OIDFieldName')
+
+#: arcpy.ListFields results keyed by dataset path. only populated while `update` is running
+_fields_cache = None
+
 
 def init(logger):
     '''
@@ -73,6 +85,9 @@ def update(crate, validate_crate, change_detection):
     Checks to see if a crate can be updated by using validate_crate (if implemented
     within the pallet) or check_schema otherwise. If the crate is valid it then updates the data.
     '''
+    global _fields_cache
+    _fields_cache = {}
+
     arcpy.env.geographicTransformations = crate.geographic_transformation
     change_status = (Crate.NO_CHANGES, None)
 
@@ -113,10 +128,7 @@ def update(crate, validate_crate, change_detection):
                         change_status = (Crate.UPDATED, None)
 
                     log.debug('deleting from destintation table')
-                    with arcpy.da.UpdateCursor(crate.destination, hash_field) as cursor:
-                        for row in cursor:
-                            if row[0] in changes._deletes:
-                                cursor.deleteRow()
+                    _delete_rows(crate.destination, changes._deletes)
 
                 #: add new/updated rows
                 if changes.has_adds():
@@ -131,19 +143,21 @@ def update(crate, validate_crate, change_detection):
                             changes.table, changes.table + reproject_temp_suffix, crate.destination_coordinate_system, crate.geographic_transformation
                         )[0]
 
-                    if not crate.is_table():
-                        changes.fields[shape_field_index] = changes.fields[shape_field_index].rstrip('WKT')
-
                     #: cache this so we don't have to call it for every record
                     is_table = crate.is_table()
+                    if not is_table:
+                        changes.fields[shape_field_index] = changes.fields[shape_field_index].rstrip('WKB')
+
                     with arcpy.da.SearchCursor(changes.table, changes.fields) as add_cursor,\
                             arcpy.da.InsertCursor(crate.destination, changes.fields) as cursor:
+                        #: bind the method once rather than looking it up for every record
+                        insert_row = cursor.insertRow
                         for row in add_cursor:
                             #: skip null geometries
                             if not is_table and row[shape_field_index] is None:
                                 continue
 
-                            cursor.insertRow(row)
+                            insert_row(row)
 
             if changes.has_dups:
                 change_status = (Crate.UPDATED_OR_CREATED_WITH_WARNINGS, 'duplicate features detected!')
@@ -162,6 +176,7 @@ def update(crate, validate_crate, change_detection):
 
         return (Crate.UNHANDLED_EXCEPTION, str(e))
     finally:
+        _fields_cache = None
         arcpy.ResetEnvironments()
         arcpy.ClearWorkspaceCache_management()
 
@@ -171,14 +186,16 @@ def _hash(crate):
 
     returns a Changes model with deltas for the source
     '''
-    shape_token = 'SHAPE@WKT'
+    shape_token = 'SHAPE@WKB'
+    #: cache this so we don't have to call it for every record
+    is_table = crate.is_table()
 
     log.info('checking for changes...')
     #: finding and filtering common fields between source and destination
-    fields = set([fld.name for fld in arcpy.ListFields(crate.destination)]) & set([fld.name for fld in arcpy.ListFields(crate.source)])
+    fields = {fld.name for fld in _list_fields(crate.destination)} & {fld.name for fld in _list_fields(crate.source)}
     fields = _filter_fields(fields)
 
-    if not crate.is_table():
+    if not is_table:
         fields.append(shape_token)
     fields.append(hash_field)
 
@@ -191,7 +208,7 @@ def _hash(crate):
     if arcpy.Exists(temp_table):
         arcpy.Delete_management(temp_table)
 
-    if not crate.is_table():
+    if not is_table:
         changes.table = arcpy.CreateFeatureclass_management(
             scratch_gdb_path,
             crate.name,
@@ -208,19 +225,24 @@ def _hash(crate):
     arcpy.AddField_management(changes.table, hash_field, 'TEXT', field_length=hash_field_length)
 
     has_dups = False
+    #: bind these once rather than looking them up for every record
+    adds = changes.adds
+    unchanged = changes.unchanged
+    remove_hash = attribute_hashes.remove
     with arcpy.da.SearchCursor(crate.source, [field for field in fields if field != hash_field]) as cursor, \
             arcpy.da.InsertCursor(changes.table, changes.fields) as insert_cursor:
+        insert_row = insert_cursor.insertRow
         for row in cursor:
             total_rows += 1
 
-            if not crate.is_table():
+            if not is_table:
                 #: skip features with empty geometry
                 if row[-1] is None:
                     log.warning('empty geometry found in %s', row)
                     total_rows -= 1
                     continue
 
-                #: do this in two parts to prevent creating an unnecessary copy of the WKT
+                #: do this in two parts to prevent creating an unnecessary copy of the WKB
                 row_hash = xxh64(str(row[:-1]))
                 row_hash.update(row[-1])
             else:
@@ -229,7 +251,7 @@ def _hash(crate):
             digest = row_hash.hexdigest()
 
             #: check for duplicate hashes
-            while digest in changes.adds or digest in changes.unchanged:
+            while digest in adds or digest in unchanged:
                 has_dups = True
                 row_hash.update(digest)
                 digest = row_hash.hexdigest()
@@ -238,14 +260,14 @@ def _hash(crate):
             if digest not in attribute_hashes:
                 #: update or add
                 #: insert into temp table
-                insert_cursor.insertRow(row + (digest,))
+                insert_row(row + (digest,))
                 #: add to adds
-                changes.adds[digest] = None
+                adds[digest] = None
             else:
                 #: remove not modified hash from hashes
-                attribute_hashes.pop(digest)
+                remove_hash(digest)
 
-                changes.unchanged[digest] = None
+                unchanged[digest] = None
 
     changes.determine_deletes(attribute_hashes)
     changes.total_rows = total_rows
@@ -257,6 +279,35 @@ def _hash(crate):
     return changes
 
 
+def _delete_rows(destination, hashes):
+    '''destination: string - path to destination data
+    hashes: set of hashes to delete
+
+    Deletes the rows with the hashes. When the hashes fit in one where clause the rows are queried so that the
+    engine filters them. FORKLIFT_HASH is not indexed so more where clauses would each scan the destination;
+    larger deletes are found in a single pass instead.
+    '''
+    if len(hashes) <= delete_batch_size:
+        with arcpy.da.UpdateCursor(destination, hash_field, _get_delete_where_clause(hashes)) as cursor:
+            for _ in cursor:
+                cursor.deleteRow()
+
+        return
+
+    with arcpy.da.UpdateCursor(destination, hash_field) as cursor:
+        for row in cursor:
+            if row[0] in hashes:
+                cursor.deleteRow()
+
+
+def _get_delete_where_clause(hashes):
+    '''hashes: set of hashes to delete
+
+    returns a where clause that selects the rows with the hashes
+    '''
+    return '{} IN ({})'.format(hash_field, ', '.join("'{}'".format(digest) for digest in sorted(hashes)))
+
+
 def _create_destination_data(crate, skip_hash_field=False):
     '''crate: Crate
 
@@ -288,20 +339,19 @@ def _create_destination_data(crate, skip_hash_field=False):
     if not skip_hash_field:
         arcpy.AddField_management(crate.destination, hash_field, 'TEXT', field_length=hash_field_length)
 
+    if _fields_cache is not None:
+        _fields_cache.pop(crate.destination, None)
+
 
 def _get_hash_lookups(destination):
     '''destination: string - path to destination data
 
-    returns a hash lookup for all attributes including geometries
+    returns a set of the hashes for all attributes including geometries
     '''
-    hash_lookup = {}
-
-    with arcpy.da.SearchCursor(destination, [hash_field]) as cursor:
-        for att_hash, in cursor:
-            if att_hash is not None:
-                hash_lookup[str(att_hash)] = None
+    #: read the whole column in one call rather than a row at a time
+    hashes = arcpy.da.TableToNumPyArray(destination, [hash_field], skip_nulls=True)
 
-    return hash_lookup
+    return set(hashes[hash_field].tolist())
 
 
 def check_schema(crate):
@@ -313,7 +363,7 @@ def check_schema(crate):
     def get_fields(dataset, describe):
         field_dict = {}
 
-        for field in arcpy.ListFields(dataset):
+        for field in _list_fields(dataset):
             #: don't worry about comparing managed fields
             if not _is_naughty_field(field.name, describe):
                 field_dict[field.name] = field
@@ -326,19 +376,25 @@ def check_schema(crate):
         else:
             return type
 
+    def truncate_field_length(field):
+        if field.length > 4000:
+            log.warning('%s is longer than 4000 characters. Truncation may occur.', field.name)
+            return 4000
+        else:
+            return field.length
+
     log.info('checking schema...')
     missing_fields = []
     mismatching_fields = []
     source_fields = get_fields(crate.source, crate.source_describe)
     destination_fields = get_fields(crate.destination, arcpy.da.Describe(crate.destination))
 
-    for field_key in list(destination_fields.keys()):
+    for field_key, destination_fld in destination_fields.items():
         if field_key == hash_field:
             continue
         # make sure that all fields from destination are in source
         # not sure that we care if there are fields in source that are not in destination
-        destination_fld = destination_fields[field_key]
-        if field_key not in list(source_fields.keys()):
+        if field_key not in source_fields:
             missing_fields.append(destination_fld.name)
         else:
             source_fld = source_fields[field_key]
@@ -347,14 +403,6 @@ def check_schema(crate):
                     '{}: source type of {} does not match destination type of {}'.format(source_fld.name, source_fld.type, destination_fld.type)
                 )
             elif source_fld.type == 'String':
-
-                def truncate_field_length(field):
-                    if field.length > 4000:
-                        log.warning('%s is longer than 4000 characters. Truncation may occur.', field.name)
-                        return 4000
-                    else:
-                        return field.length
-
                 source_fld.length = truncate_field_length(source_fld)
                 destination_fld.length = truncate_field_length(destination_fld)
                 if source_fld.length != destination_fld.length:
@@ -376,6 +424,22 @@ def check_schema(crate):
         return True
 
 
+def _list_fields(dataset):
+    '''dataset: string - path to a table or feature class
+
+    returns: Field[]
+
+    Returns arcpy.ListFields for the dataset. During `update` the result is reused for the rest of the crate.
+    '''
+    if _fields_cache is None:
+        return arcpy.ListFields(dataset)
+
+    if dataset not in _fields_cache:
+        _fields_cache[dataset] = arcpy.ListFields(dataset)
+
+    return _fields_cache[dataset]
+
+
 def _filter_fields(fields):
     '''fields: String[]
 
@@ -396,16 +460,18 @@ def _is_naughty_field(field, describe=None):
 
     determines if field is a field that we want to exclude from hashing
     '''
-    #: global id's do not export to file geodatabase
+    field = field.lower()
+
     #: removes objectid_ which is created by geoprocessing tasks and wouldn't be in destination source
-    skip_fields = ['global_id', 'globalid']
+    if 'shape' in field or field in _skip_fields or field.startswith('objectid'):
+        return True
 
     if describe is not None:
-        for prop in ['shapeFieldName', 'lengthFieldName', 'OIDFieldName']:
-            if prop in describe:
-                skip_fields.append(describe[prop].lower())
-    field = field.lower()
-    return 'shape' in field or field in skip_fields or field.startswith('objectid')
+        for prop in _skip_field_props:
+            if prop in describe and describe[prop].lower() == field:
+                return True
+
+    return False
 
 
 def _check_counts(crate, changes):
@@ -9,20 +9,19 @@ A module that contains the implementation of the cli commands
 import logging
 import socket
 import sys
-from imp import load_source
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import module_from_spec, spec_from_file_location
+from inspect import isclass
 from json import dump, load
-from os import linesep, listdir, walk
-from os.path import (abspath, basename, dirname, exists, join, normpath,
-                     realpath, splitext)
-from re import compile
+from os import linesep, listdir, scandir
+from os.path import (abspath, basename, dirname, exists, join, normcase,
+                     normpath, realpath, splitext)
 from shutil import copytree, rmtree
 from time import perf_counter, sleep
 
-import pystache
 from colorama import Fore
 from colorama import init as colorama_init
-from git import Repo
-from requests import get
+from requests import RequestException, Session, head
 
 from . import config, core, lift, seat
 from .arcgis import LightSwitch
@@ -37,10 +36,14 @@ lift_template = join(abspath(dirname(__file__)), 'templates', 'lift.html')
 ship_template = join(abspath(dirname(__file__)), 'templates', 'ship.html')
 speedtest_destination = join(dirname(realpath(__file__)), '..', '..', 'speedtest', 'data')
 packing_slip_file = 'packing-slip.json'
+#: a requests.Session pools up to 10 connections per host. more threads than that open connections that are discarded
+max_repo_workers = 10
+#: seconds to wait on github before giving up on validating a repository
+repo_timeout = 5
+#: the most repositories that are cloned or pulled from github at once
+max_git_workers = 8
 colorama_init()
 
-pallet_file_regex = compile(r'pallet.*\.py$')
-
 
 def init():
     '''Creates the default config in the forklift-garage if it does not exists
@@ -105,11 +108,9 @@ def list_repos():
     '''
     folders = _get_repos()
 
-    validate_results = []
-    for folder in folders:
-        validate_results.append(_validate_repo(folder))
-
-    return validate_results
+    #: share one keep-alive connection pool and check the repositories concurrently
+    with Session() as session, ThreadPoolExecutor(max_workers=min(max_repo_workers, len(folders)) or 1) as executor:
+        return list(executor.map(lambda folder: _validate_repo(folder, session=session), folders))
 
 
 def lift_pallets(file_path=None, pallet_arg=None, skip_git=False):
@@ -136,6 +137,7 @@ def lift_pallets(file_path=None, pallet_arg=None, skip_git=False):
         git_errors = []
 
     start_seconds = perf_counter()
+    dropoff_location = config.get_config_prop('dropoffLocation')
 
     log.debug('building pallets')
     pallets_to_lift, import_errors = build_pallets(file_path, pallet_arg)
@@ -163,27 +165,28 @@ def lift_pallets(file_path=None, pallet_arg=None, skip_git=False):
     log.info('process_pallets time: %s', seat.format_time(perf_counter() - start_process))
 
     start_process = perf_counter()
-    lift.dropoff_data(pallets_to_lift, config.get_config_prop('dropoffLocation'))
+    lift.dropoff_data(pallets_to_lift, dropoff_location)
     log.info('dropoff_data time: %s', seat.format_time(perf_counter() - start_process))
 
     start_process = perf_counter()
-    lift.gift_wrap(config.get_config_prop('dropoffLocation'))
+    lift.gift_wrap(dropoff_location)
     log.info('gift wrapping data time: %s', seat.format_time(perf_counter() - start_process))
 
     #: log process times for each pallet
-    for pallet in pallets_to_lift:
-        log.debug('processing times (in seconds) for %r: %s', pallet, pallet.processing_times)
+    if log.isEnabledFor(logging.DEBUG):
+        for pallet in pallets_to_lift:
+            log.debug('processing times (in seconds) for %r: %s', pallet, pallet.processing_times)
 
     elapsed_time = seat.format_time(perf_counter() - start_seconds)
     status = lift.get_lift_status(pallets_to_lift, elapsed_time, git_errors, import_errors)
 
-    _generate_packing_slip(status, config.get_config_prop('dropoffLocation'))
+    _generate_packing_slip(status, dropoff_location)
 
     _send_report_email(lift_template, status, 'Lifting', include_packing_slip=True)
     _send_report_to_slack(status, 'Lifting')
 
     report = _generate_console_report(status)
-    log.info('finished in {}.'.format(elapsed_time))
+    log.info('finished in %s.', elapsed_time)
 
     log.info('%s', report)
 
@@ -214,19 +217,19 @@ def ship_data(pallet_arg=None, by_service=False):
     #: look for drop off location
     pickup_location = config.get_config_prop('dropoffLocation')
 
-    files_and_folders = set(listdir(pickup_location))
-    if not exists(pickup_location) or len(files_and_folders) == 0:
+    item_count, has_packing_slip = _survey_pickup_location(pickup_location)
+    if item_count == 0:
         log.warning('no data found or packing slip found in pickup location.. exiting')
 
         return False
 
     missing_packing_slip = False
-    if packing_slip_file not in files_and_folders:
+    if not has_packing_slip:
         missing_packing_slip = True
         log.info('no packing slip found in pickup location... copying data only')
 
     ship_only = False
-    if missing_packing_slip is False and len(files_and_folders) == 1:
+    if missing_packing_slip is False and item_count == 1:
         log.info('only packing slip found in pickup location... shipping pallets only')
         ship_only = True
 
@@ -239,6 +242,12 @@ def ship_data(pallet_arg=None, by_service=False):
 
         if by_service:
             all_pallets, _ = build_pallets(None, pallet_arg)
+            data_being_moved = set(listdir(pickup_location)) - set([packing_slip_file])
+            services_affected = _get_affected_services(data_being_moved, all_pallets)
+
+        #: these are the same for every server so only look them up once
+        ship_to = config.get_config_prop('shipTo')
+        sleep_timer = config.get_config_prop('serverStartWaitSeconds')
 
         #: for each server
         for switch in switches:
@@ -249,8 +258,6 @@ def ship_data(pallet_arg=None, by_service=False):
 
             #: stop server or services
             if by_service:
-                data_being_moved = set(listdir(config.get_config_prop('dropoffLocation'))) - set([packing_slip_file])
-                services_affected = _get_affected_services(data_being_moved, all_pallets)
                 status, messages = switch.ensure_services('off', services_affected)
                 item_being_acted_upon = ', '.join([service_info[0] for service_info in services_affected])
             else:
@@ -268,16 +275,13 @@ def ship_data(pallet_arg=None, by_service=False):
                 continue
 
             #: wait period (failover logic)
-            sleep_timer = config.get_config_prop('serverStartWaitSeconds')
             log.debug('sleeping: %s', sleep_timer)
             sleep(sleep_timer)
 
             start_sub_process = perf_counter()
 
             #: copy data
-            successful_copies, failed_copies = lift.copy_data(
-                config.get_config_prop('dropoffLocation'), config.get_config_prop('shipTo'), packing_slip_file, switch.server_qualified_name
-            )
+            successful_copies, failed_copies = lift.copy_data(pickup_location, ship_to, packing_slip_file, switch.server_qualified_name)
             server_report['successful_copies'] = successful_copies
             server_report['failed_copies'] = failed_copies
             all_failed_copies.update(failed_copies)
@@ -498,9 +502,33 @@ def git_update():
         return []
 
     errors = []
-    for repo in repositories:
-        error, info = _clone_or_pull_repo(repo)
+    to_update = []
+    folders = {}
+    for repo_name in repositories:
+        try:
+            folder = _get_repo_folder_name(repo_name)
+        except Exception:
+            #: let _clone_or_pull_repo report the malformed repository
+            to_update.append(repo_name)
+            continue
+
+        #: repositories with the same name but different owners would be cloned into the same warehouse folder
+        if folder in folders:
+            error = 'Git update error for {}: {} is already cloned into the {} warehouse folder'.format(
+                _get_safe_repo_name(repo_name), _get_safe_repo_name(folders[folder]), folder
+            )
+            log.error(error)
+            errors.append(error)
+            continue
+
+        folders[folder] = repo_name
+        to_update.append(repo_name)
 
+    #: cloning and pulling is network bound so the repositories can be updated in parallel
+    with ThreadPoolExecutor(max_workers=min(max_git_workers, len(to_update))) as executor:
+        results = list(executor.map(_clone_or_pull_repo, to_update))
+
+    for error, info in results:
         if info is not None:
             log.info(info)
         if error is not None:
@@ -597,6 +625,28 @@ def build_pallets(file_path, pallet_arg=None):
     return pallets, import_errors
 
 
+def _survey_pickup_location(pickup_location):
+    '''pickup_location: string - the drop off location folder
+
+    counts the items in `pickup_location` and looks for the packing slip in a single pass
+
+    returns a tuple of the number of files and folders and whether the packing slip was found
+    '''
+    item_count = 0
+    has_packing_slip = False
+
+    try:
+        with scandir(pickup_location) as entries:
+            for entry in entries:
+                item_count += 1
+                if entry.name == packing_slip_file:
+                    has_packing_slip = True
+    except FileNotFoundError:
+        pass
+
+    return item_count, has_packing_slip
+
+
 def _generate_packing_slip(status, location):
     '''
     status: report object
@@ -648,6 +698,8 @@ def _send_report_email(template, report_object, subject, include_packing_slip=Fa
     subject: string - a string to insert into the email subject line
     include_packing_slip: boolean - if true, the packing slip is attached to the email
     '''
+    import pystache
+
     log_file = join(dirname(config.config_location), 'forklift.log')
 
     with open(template, 'r') as template_file:
@@ -688,7 +740,7 @@ def _send_report_to_slack(status, operation):
     try:
         send_to_slack(url, messages)
     except Exception as exc:
-        log.error(f'Error posting report to slack: {exc}')
+        log.error('Error posting report to slack: %s', exc)
 
 
 def _clone_or_pull_repo(repo_name):
@@ -705,9 +757,10 @@ def _clone_or_pull_repo(repo_name):
 
     returns a status tuple with None being successful or a string with the error
     '''
+    from git import Repo
+
     warehouse = config.get_config_prop('warehouse')
     log_message = None
-    shorthand = True
     safe_repo_name = None
 
     FAST_FORWARD = 64
@@ -715,16 +768,9 @@ def _clone_or_pull_repo(repo_name):
     HEAD_UPTODATE = 4
 
     try:
-        if isinstance(repo_name, str):
-            folder = join(warehouse, repo_name.split('/')[1])
-        else:
-            shorthand = False
-            folder = join(warehouse, repo_name['repo'].split('/')[1])
-
-        if shorthand:
-            safe_repo_name = repo_name
-        else:
-            safe_repo_name = repo_name['repo']
+        shorthand = isinstance(repo_name, str)
+        safe_repo_name = _get_safe_repo_name(repo_name)
+        folder = join(warehouse, _get_repo_folder_name(repo_name))
 
         if not exists(folder):
             repo = Repo.clone_from(_repo_to_url(repo_name, shorthand), join(warehouse, folder))
@@ -748,7 +794,28 @@ def _clone_or_pull_repo(repo_name):
         return ('Git update error for {}: {}'.format(safe_repo_name, e), log_message)
 
 
+def _get_safe_repo_name(repo_name):
+    '''repo_name: string or object - a repository from the config repositories section
+
+    returns the username/reponame of the repository without any access token
+    '''
+    if isinstance(repo_name, str):
+        return repo_name
+
+    return repo_name['repo']
+
+
+def _get_repo_folder_name(repo_name):
+    '''repo_name: string or object - a repository from the config repositories section
+
+    returns the name of the warehouse folder that the repository is cloned into
+    '''
+    return _get_safe_repo_name(repo_name).split('/')[1]
+
+
 def _get_repo(folder):
+    from git import Repo
+
     #: abstraction to enable mocking in tests
     return Repo(folder)
 
@@ -764,19 +831,31 @@ def _get_repos():
     return config.get_config_prop('repositories')
 
 
-def _validate_repo(repo, raises=False):
+def _validate_repo(repo, raises=False, session=None):
     '''
     repo: string - the owner/name of a repository
     raises: boolean - an optional flag to raise an exception if the github repository is not valid
+    session: requests.Session - an optional session to reuse connections across requests
 
-    makes an http request to the github url to validate the repository exists
+    makes an http HEAD request to the github url to validate the repository exists
 
     returns a validation string or an exception depending on `raises`
     '''
     url = _repo_to_url(repo)
-    response = get(url)
+    try:
+        if session is None:
+            response = head(url, allow_redirects=True, timeout=repo_timeout)
+        else:
+            response = session.head(url, allow_redirects=True, timeout=repo_timeout)
+    except RequestException as error:
+        log.warning('could not reach %s: %s', repo, type(error).__name__)
+        response = None
 
-    if response.status_code == 200:
+    if response is None:
+        message = '[Could not reach repository]'
+        if raises:
+            raise Exception('{}: {}'.format(repo, message))
+    elif response.status_code == 200:
         message = '[Valid]'
     else:
         message = '[Invalid repo name or owner]'
@@ -789,25 +868,64 @@ def _validate_repo(repo, raises=False):
 def _get_pallets_in_folder(folder):
     '''folder: string - a path to a folder
 
-    finds all pallet classes in `folder` looking only in `pallet_file_regex` matching files
+    finds all pallet classes in `folder` looking only in files accepted by `_is_pallet_file`
 
     returns an array of tuples consisting of the file path and the pallet class object
     '''
     pallets = []
     import_errors = []
 
-    for root, _, files in walk(folder):
-        for file_name in files:
-            if pallet_file_regex.search(file_name.lower()):
-                new_pallets, import_error = _get_pallets_in_file(join(root, file_name))
-                pallets.extend(new_pallets)
+    for file_path in _iter_pallet_files(folder):
+        new_pallets, import_error = _get_pallets_in_file(file_path)
+        pallets.extend(new_pallets)
 
-                if import_error is not None:
-                    import_errors.append(import_error)
+        if import_error is not None:
+            import_errors.append(import_error)
 
     return pallets, import_errors
 
 
+def _iter_pallet_files(folder):
+    '''folder: string - a path to a folder
+
+    walks `folder` top down (the same order as `os.walk`) using the file type information that
+    `scandir` returns with the directory listing rather than stat'ing every file
+
+    yields the paths to the files accepted by `_is_pallet_file`
+    '''
+    file_paths = []
+    sub_folders = []
+
+    try:
+        with scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    #: like os.walk, don't follow symlinked folders
+                    if not entry.is_symlink():
+                        sub_folders.append(entry.path)
+                elif _is_pallet_file(entry.name):
+                    file_paths.append(entry.path)
+    except OSError:
+        #: like os.walk, skip folders that can't be read
+        return
+
+    yield from file_paths
+
+    for sub_folder in sub_folders:
+        yield from _iter_pallet_files(sub_folder)
+
+
+def _is_pallet_file(file_name):
+    '''file_name: string - the name of a file
+
+    returns true if the file is a python file with `pallet` (case-insensitive) somewhere in its name
+    '''
+    file_name = file_name.lower()
+
+    #: the same as searching for `pallet.*\.py$` without running the regex engine
+    return file_name.endswith('.py') and 'pallet' in file_name[:-3]
+
+
 def _get_pallets_in_file(file_path):
     '''file_path: string - a path to a pallet.py file
 
@@ -830,32 +948,50 @@ def _get_pallets_in_file(file_path):
         sys.path.append(folder)
 
     try:
-        try:
-            mod = sys.modules[file_name]
-        except KeyError:
-            mod = load_source(file_name, file_path)
+        mod = _load_pallet_module(file_name, file_path)
     except Exception as e:
         # skip modules that fail to import
         log.error('%s failed to import: %s', file_path, e, exc_info=True)
         return ([], 'pallet failed to import: {}, {}'.format(file_path, e))
 
-    for member in dir(mod):
-        try:
-            potential_class = getattr(mod, member)
-            if issubclass(potential_class, Pallet) and potential_class != Pallet:
-                if specific_pallet is None:
-                    pallets.append((file_path, potential_class))
-                    continue
-
-                if potential_class.__name__ == specific_pallet:
-                    pallets.append((file_path, potential_class))
-        except Exception:
-            #: member was likely not a class
-            pass
+    #: sort by name so the pallets in a file are returned in alphabetical order
+    for _, potential_class in sorted(vars(mod).items()):
+        if not isclass(potential_class) or not issubclass(potential_class, Pallet) or potential_class is Pallet:
+            continue
+
+        if specific_pallet is None or potential_class.__name__ == specific_pallet:
+            pallets.append((file_path, potential_class))
 
     return (pallets, None)
 
 
+def _load_pallet_module(module_name, file_path):
+    '''module_name: string - the name to import the module as
+    file_path: string - a path to a pallet.py file
+
+    imports the file as `module_name` unless that module has already been imported from the same file
+
+    returns the module
+    '''
+    mod = sys.modules.get(module_name)
+    module_file = getattr(mod, '__file__', None)
+    if module_file is not None and normcase(realpath(module_file)) == normcase(realpath(file_path)):
+        return mod
+
+    spec = spec_from_file_location(module_name, file_path)
+    mod = module_from_spec(spec)
+
+    #: register before executing, the same as a regular import, so the module can find itself
+    sys.modules[module_name] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except Exception:
+        del sys.modules[module_name]
+        raise
+
+    return mod
+
+
 def _generate_console_report(pallet_reports):
     '''pallet_reports: object - the report object
 
@@ -863,42 +999,50 @@ def _generate_console_report(pallet_reports):
 
     returns the formatted report string
     '''
-    report_str = '{3}{3}    {4}{0}{2} out of {5}{1}{2} pallets ran successfully in {6}.{3}'.format(
-        pallet_reports['num_success_pallets'], len(pallet_reports['pallets']), Fore.RESET, linesep, Fore.GREEN, Fore.CYAN, pallet_reports['total_time']
-    )
-
-    if len(pallet_reports['git_errors']) > 0:
-        for git_error in pallet_reports['git_errors']:
-            report_str += '{}{}{}'.format(Fore.RED, git_error, linesep)
-
-    if len(pallet_reports['import_errors']) > 0:
-        for import_error in pallet_reports['import_errors']:
-            report_str += '{}{}{}'.format(Fore.RED, import_error, linesep)
+    #: bind the colors and line separator once rather than looking them up for every crate
+    reset = Fore.RESET
+    green = Fore.GREEN
+    red = Fore.RED
+    yellow = Fore.YELLOW
+    cyan = Fore.CYAN
+    newline = linesep
+
+    report_parts = [
+        f'{newline}{newline}    {green}{pallet_reports["num_success_pallets"]}{reset} out of {cyan}{len(pallet_reports["pallets"])}{reset} '
+        f'pallets ran successfully in {pallet_reports["total_time"]}.{newline}'
+    ]
+    append = report_parts.append
+
+    for git_error in pallet_reports['git_errors']:
+        append(f'{red}{git_error}{newline}')
+
+    for import_error in pallet_reports['import_errors']:
+        append(f'{red}{import_error}{newline}')
 
     for report in pallet_reports['pallets']:
-        color = Fore.GREEN
+        color = green
         if not report['success']:
-            color = Fore.RED
+            color = red
 
-        report_str += '{0}{1}{2} ({4}){3}'.format(color, report['name'], Fore.RESET, linesep, report['total_processing_time'])
+        append(f'{color}{report["name"]}{reset} ({report["total_processing_time"]}){newline}')
 
         if report['message']:
-            report_str += 'pallet message: {}{}{}{}'.format(Fore.RED, report['message'], Fore.RESET, linesep)
+            append(f'pallet message: {red}{report["message"]}{reset}{newline}')
 
         for crate in report['crates']:
-            report_str += '{0:>40} - {1}{3}{2}'.format(crate['name'], crate['result'], linesep, Fore.RESET)
+            append(f'{crate["name"]:>40} - {crate["result"]}{reset}{newline}')
 
             if crate['crate_message'] is None or len(crate['crate_message']) < 1:
                 continue
 
             if crate['message_level'] == 'warning':
-                color = Fore.YELLOW
+                color = yellow
             else:
-                color = Fore.RED
+                color = red
 
-            report_str += 'crate message: {0}{1}{2}{3}'.format(color, crate['crate_message'], Fore.RESET, linesep)
+            append(f'crate message: {color}{crate["crate_message"]}{reset}{newline}')
 
-    return report_str
+    return ''.join(report_parts)
 
 
 def _generate_ship_console_report(pallet_reports):
@@ -908,50 +1052,50 @@ def _generate_ship_console_report(pallet_reports):
 
     returns the formatted report string
     '''
-    report_str = '{3}{3}    {4}{0}{2} out of {5}{1}{2} pallets ran successfully in {6}.{3}'.format(
+    report_parts = ['{3}{3}    {4}{0}{2} out of {5}{1}{2} pallets ran successfully in {6}.{3}'.format(
         pallet_reports['num_success_pallets'], pallet_reports['total_pallets'], Fore.RESET, linesep, Fore.GREEN, Fore.CYAN, pallet_reports['total_time']
-    )
+    )]
 
     for report in pallet_reports['server_reports']:
         color = Fore.GREEN
         if not report['success']:
             color = Fore.RED
 
-        report_str += f'{linesep}ArcGIS Server Service Status for {Fore.CYAN}{report["name"]}{Fore.RESET}{linesep}'
+        report_parts.append(f'{linesep}ArcGIS Server Service Status for {Fore.CYAN}{report["name"]}{Fore.RESET}{linesep}')
 
         if report.get('has_service_issues', False):
-            report_str += f'  {Fore.RED}Problem Services{Fore.RESET}{linesep}'
+            report_parts.append(f'  {Fore.RED}Problem Services{Fore.RESET}{linesep}')
 
             for service in report['problem_services']:
-                report_str += f'    {Fore.RED}{service}{Fore.RESET}{linesep}'
+                report_parts.append(f'    {Fore.RED}{service}{Fore.RESET}{linesep}')
         elif report['success']:
-            report_str += f'    {Fore.GREEN}All services started{Fore.RESET}{linesep}'
+            report_parts.append(f'    {Fore.GREEN}All services started{Fore.RESET}{linesep}')
 
         if not report['success']:
-            report_str += f'    {Fore.RED}{report["message"]}{Fore.RESET}{linesep}'
+            report_parts.append(f'    {Fore.RED}{report["message"]}{Fore.RESET}{linesep}')
 
-        report_str += f'  Datasets Copied{linesep}'
+        report_parts.append(f'  Datasets Copied{linesep}')
         if len(report['successful_copies']) < 1:
-            report_str += f'    {Fore.RED}No data updated{Fore.RESET}{linesep}'
+            report_parts.append(f'    {Fore.RED}No data updated{Fore.RESET}{linesep}')
         else:
             for data in report['successful_copies']:
-                report_str += f'    {Fore.CYAN}{data}{Fore.RESET}{linesep}'
+                report_parts.append(f'    {Fore.CYAN}{data}{Fore.RESET}{linesep}')
 
-    report_str += f'{linesep}Pallet Report{linesep}'
+    report_parts.append(f'{linesep}Pallet Report{linesep}')
     for report in pallet_reports['pallets']:
         color = Fore.GREEN
         if not report['success']:
             color = Fore.RED
 
-        report_str += f'  {color}{report["name"]}{Fore.RESET} ({report["total_processing_time"]}){linesep}'
-        report_str += '  Post Copy Processed: {2}{0}{3}    Shipped: {2}{1}{3}{4}'.format(
+        report_parts.append(f'  {color}{report["name"]}{Fore.RESET} ({report["total_processing_time"]}){linesep}')
+        report_parts.append('  Post Copy Processed: {2}{0}{3}    Shipped: {2}{1}{3}{4}'.format(
             report['post_copy_processed'], report['shipped'], Fore.CYAN, Fore.RESET, linesep
-        )
+        ))
 
         if report['message']:
-            report_str += f'  pallet message: {color}{report["message"]}{Fore.RESET}{linesep}'
+            report_parts.append(f'  pallet message: {color}{report["message"]}{Fore.RESET}{linesep}')
 
-    return report_str
+    return ''.join(report_parts)
 
 
 def _get_affected_services(data_being_moved, all_pallets):
@@ -27,8 +27,9 @@ def process_checklist(config):
     removes the dropoffLocation and creates the hasLocation if needed
     '''
     hash_location = config.get_config_prop('hashLocation')
-    _remove_if_exists(config.get_config_prop('dropoffLocation'))
-    _create_if_not_exists([hash_location, config.get_config_prop('dropoffLocation')])
+    dropoff_location = config.get_config_prop('dropoffLocation')
+    _remove_if_exists(dropoff_location)
+    _create_if_not_exists([hash_location, dropoff_location])
     if not arcpy.Exists(path.join(hash_location, change_detection.hash_fgdb_name)):
         log.debug('creating change detection fgdb')
         arcpy.management.CreateFileGDB(hash_location, change_detection.hash_fgdb_name)
@@ -186,7 +187,7 @@ def _move_to_dropoff(destination_and_pallet, dropoff_location):
     '''
     for data_source in destination_and_pallet:
         gdb_name = path.basename(data_source)
-        log.info('copying {} to {}...'.format(data_source, path.join(dropoff_location, gdb_name)))
+        log.info('copying %s to %s...', data_source, path.join(dropoff_location, gdb_name))
         start_seconds = perf_counter()
         try:
             log.debug('copying source to destination')
@@ -273,7 +274,7 @@ def copy_data(from_location, to_template, packing_slip_file, machine_name=None):
         source_path = path.join(from_location, source)
         destination_path = path.join(to_template.format(machine_name), source)
 
-        log.info('copying {} to {}...'.format(source, destination_path))
+        log.info('copying %s to %s...', source, destination_path)
         start_seconds = perf_counter()
         try:
             if path.exists(destination_path):
@@ -472,7 +472,7 @@ class Changes(object):
 
     def __init__(self, fields):
         self.adds = {}
-        self._deletes = {}
+        self._deletes = set()
         self.unchanged = {}
         self.fields = fields
         self.table = ''
@@ -495,7 +495,7 @@ class Changes(object):
         return self.has_adds() or self.has_deletes()
 
     def determine_deletes(self, attribute_hashes):
-        '''attribute_hashes: Dictionary<string, hash> of id's and hashes that were not accessed
+        '''attribute_hashes: Set<string> of hashes that were not accessed
 
         returns the deletes
         '''
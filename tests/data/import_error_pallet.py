@@ -0,0 +1,15 @@
+#!/usr/bin/env python
+# * coding: utf8 *
+'''
+import_error_pallet.py
+
+A module that raises while it is imported to be used in test_engine.py tests
+'''
+
+from forklift.models import Pallet
+
+raise ImportError('this pallet fails to import')
+
+
+class ImportErrorPallet(Pallet):
+    pass
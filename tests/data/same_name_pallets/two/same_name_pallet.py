@@ -0,0 +1,15 @@
+#!/usr/bin/env python
+# * coding: utf8 *
+'''
+same_name_pallet.py
+
+A module that shares its file name with a pallet in another folder to be used in test_engine.py tests
+'''
+
+from forklift.models import Pallet
+
+
+class SameNamePalletTwo(Pallet):
+
+    def __init__(self):
+        super(SameNamePalletTwo, self).__init__()
@@ -28,18 +28,20 @@ class TestChanges(unittest.TestCase):
         self.assertFalse(self.patient.has_deletes())
 
     def test_has_deletes_is_false_when_hashes_are_emtpy(self):
-        attribute_hashes = {}
+        attribute_hashes = set()
 
         self.patient.determine_deletes(attribute_hashes)
 
         self.assertFalse(self.patient.has_deletes())
 
     def test_has_deletes_is_true_with_values(self):
-        attribute_hashes = {'key': 1}
+        attribute_hashes = {'key'}
 
         self.patient.determine_deletes(attribute_hashes)
 
         self.assertTrue(self.patient.has_deletes())
+        self.assertIn('key', self.patient._deletes)
+        self.assertNotIn('other', self.patient._deletes)
 
     def test_has_changes(self):
         self.assertFalse(self.patient.has_changes())
@@ -50,15 +52,12 @@ class TestChanges(unittest.TestCase):
 
         self.patient.adds = {}
 
-        attribute_hashes = {
-            'key1': 1,
-            'key2': 2,
-            'key3': 3,
-        }
+        attribute_hashes = {'key1', 'key2', 'key3'}
 
         self.patient.determine_deletes(attribute_hashes)
 
         self.assertTrue(self.patient.has_changes())
+        self.assertEqual(len(self.patient._deletes), 3)
 
         self.patient.adds = {1: 'a', 2: 'b'}
 
@@ -85,3 +85,46 @@ class ConfigTest(unittest.TestCase):
         self.assertEqual(servers['1'], {'machineName': '1-host', 'username': 'username', 'password': 'password', 'port': 0})
 
         self.assertEqual(servers['2'], {'machineName': '2-host', 'username': 'other-username', 'password': 'other-password', 'port': 1})
+
+    def test_get_config_returns_a_copy_of_the_cached_config(self):
+        config.create_default_config()
+
+        first = config._get_config()
+        first['warehouse'] = 'mutated'
+
+        self.assertNotEqual(config._get_config()['warehouse'], 'mutated')
+
+    def test_set_config_prop_refreshes_cached_config(self):
+        config.create_default_config()
+        config._get_config()
+
+        config.set_config_prop('warehouse', 'new warehouse', override=True)
+
+        self.assertEqual(config.get_config_prop('warehouse'), 'new warehouse')
+
+    @patch('forklift.config._get_config')
+    def test_set_config_prop_skips_duplicate_items_from_list(self, mock_obj):
+        mock_obj.return_value = {'test': [1, 2]}
+
+        config.set_config_prop('test', [2, 3, 3, 4])
+
+        self.assertEqual(mock_obj.return_value['test'], [1, 2, 3, 4])
+
+    @patch('forklift.config._get_config')
+    def test_set_config_prop_skips_duplicate_unhashable_items_from_list(self, mock_obj):
+        repo = {'host': 'gitlabs.com/', 'repo': 'name/repo', 'token': 'token'}
+        mock_obj.return_value = {'test': ['owner/name', repo]}
+
+        config.set_config_prop('test', [repo, 'owner/other'])
+
+        self.assertEqual(mock_obj.return_value['test'], ['owner/name', repo, 'owner/other'])
+
+    @patch('forklift.config.dump')
+    @patch('forklift.config._get_config')
+    def test_set_config_prop_does_not_write_if_list_items_already_exist(self, mock_obj, dump):
+        mock_obj.return_value = {'test': [1, 2, 3]}
+
+        message = config.set_config_prop('test', [1, 3])
+
+        self.assertEqual(message, 'test already contains [1, 3]')
+        dump.assert_not_called()
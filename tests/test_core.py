@@ -146,6 +146,26 @@ def test_update_new_dataset_with_change_detection(test_gdb):
 def test_filter_shape_fields():
     assert core._filter_fields(['shape', 'test', 'Shape_length', 'Global_ID']) == ['test']
 
+def test_get_delete_where_clause():
+    assert core._get_delete_where_clause({'c', 'a', 'b'}) == "FORKLIFT_HASH IN ('a', 'b', 'c')"
+
+@patch('forklift.core.delete_batch_size', 2)
+@patch('arcpy.da.UpdateCursor')
+def test_delete_rows_queries_deletes_that_fit_in_one_where_clause(update_cursor):
+    core._delete_rows('destination', {'a', 'b'})
+
+    update_cursor.assert_called_once_with('destination', 'FORKLIFT_HASH', "FORKLIFT_HASH IN ('a', 'b')")
+
+@patch('forklift.core.delete_batch_size', 2)
+@patch('arcpy.da.UpdateCursor')
+def test_delete_rows_scans_once_for_large_deletes(update_cursor):
+    update_cursor.return_value.__enter__.return_value.__iter__.return_value = iter([('a', ), ('z', ), ('c', )])
+
+    core._delete_rows('destination', {'a', 'b', 'c'})
+
+    update_cursor.assert_called_once_with('destination', 'FORKLIFT_HASH')
+    assert update_cursor.return_value.__enter__.return_value.deleteRow.call_count == 2
+
 def test_hash_custom_source_key_text(test_gdb):
     skip_if_no_local_sde()
 
@@ -214,6 +234,16 @@ def test_hash_shapefile():
 
     assert len(changes.adds) == 1
 
+def test_hash_unchanged_source_has_no_changes_on_second_run():
+    test_data_folder = path.join(SUITE_DATA_FOLDER, 'test_hash_shapefile')
+    crate = Crate('shapefile.shp', test_data_folder, TEMP_GDB, 'shapefile')
+
+    core.update(crate, lambda x: True, CHANGE_DETECTION)
+    changes = core._hash(crate)
+
+    assert len(changes.adds) == 0
+    assert len(changes._deletes) == 0
+
 def test_schema_changes(test_gdb):
 
     with pytest.raises(ValidationException):
@@ -351,8 +381,7 @@ def test_source_row_deleted(test_gdb):
 
     changes = core._hash(crate)
 
-    #: all features hashes are invalid since we deleted the first row
-    #: which changes the salt for all following rows
+    #: hashes only depend on row content so deleting a row leaves the other hashes valid
     assert len(changes.adds) == 0
     assert len(changes._deletes) == 1
 
@@ -475,3 +504,62 @@ def test_schema_ignore_non_standard_shape_length_fields(test_gdb):
     result = core.check_schema(Crate('DirectionalSurveyHeaderSource', test_gdb, test_gdb, 'DirectionalSurveyHeaderDestination'))
 
     assert result
+
+
+def mock_field(name):
+    field = Mock(type='String', length=10)
+    field.name = name
+
+    return field
+
+
+def mock_crate():
+    return Mock(source='source', destination='destination', source_describe={}, source_name='source', geographic_transformation=None)
+
+
+@patch('arcpy.ResetEnvironments', Mock())
+@patch('arcpy.ClearWorkspaceCache_management', Mock())
+@patch('arcpy.da.Describe', Mock(return_value={}))
+@patch('arcpy.Exists', Mock(return_value=True))
+@patch('forklift.core._check_counts', Mock(return_value=None))
+@patch('arcpy.ListFields', side_effect=lambda dataset: [mock_field('NAME')])
+def test_update_lists_fields_once_per_dataset(list_fields):
+    def hash_crate(crate):
+        core._list_fields(crate.destination)
+        core._list_fields(crate.source)
+
+        return Changes([])
+
+    with patch('forklift.core._hash', side_effect=hash_crate):
+        result = core.update(mock_crate(), lambda crate: NotImplemented, CHANGE_DETECTION)
+
+    assert result == (Crate.NO_CHANGES, None)
+    assert sorted(call[0][0] for call in list_fields.call_args_list) == ['destination', 'source']
+    assert core._fields_cache is None
+
+
+@patch('arcpy.da.Describe', Mock(return_value={}))
+@patch('arcpy.ListFields', side_effect=lambda dataset: [mock_field('NAME')])
+def test_list_fields_does_not_cache_outside_of_update(list_fields):
+    core.check_schema(mock_crate())
+    core.check_schema(mock_crate())
+
+    assert list_fields.call_count == 4
+    assert core._fields_cache is None
+
+
+@patch('forklift.core.path.exists', Mock(return_value=True))
+@patch('forklift.core._mirror_fields', Mock())
+@patch('arcpy.CreateTable_management', Mock())
+@patch('arcpy.AddField_management', Mock())
+def test_create_destination_data_evicts_cached_fields():
+    crate = mock_crate()
+    crate.is_table.return_value = True
+    core._fields_cache = {'destination': [], 'source': []}
+
+    try:
+        core._create_destination_data(crate)
+
+        assert list(core._fields_cache) == ['source']
+    finally:
+        core._fields_cache = None
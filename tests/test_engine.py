@@ -6,13 +6,16 @@ test_engine.py
 A module that contains tests for the engine.py module
 '''
 
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from json import loads
 from os import makedirs, remove, rmdir
 from os.path import abspath, dirname, exists, join
 
 import pytest
 from mock import Mock, mock_open, patch
+from requests import Timeout
 
 from forklift import config, core, engine
 from forklift.models import Crate
@@ -131,6 +134,31 @@ class TestRepos(CleanUpAlternativeConfig):
 
         self.assertEqual(result, ['blah: [Invalid repo name or owner]', 'blah2: [Invalid repo name or owner]'])
 
+    @patch('forklift.engine._validate_repo', return_value='')
+    @patch('forklift.engine.ThreadPoolExecutor', wraps=ThreadPoolExecutor)
+    def test_list_repos_caps_workers_to_connection_pool(self, executor, _validate_repo_mock):
+        config.set_config_prop('repositories', ['owner/repo{}'.format(number) for number in range(12)], override=True)
+
+        engine.list_repos()
+
+        executor.assert_called_once_with(max_workers=engine.max_repo_workers)
+
+    @patch('forklift.engine._validate_repo', return_value='')
+    @patch('forklift.engine.ThreadPoolExecutor', wraps=ThreadPoolExecutor)
+    def test_list_repos_no_repos(self, executor, _validate_repo_mock):
+        config.set_config_prop('repositories', [], override=True)
+
+        self.assertEqual(engine.list_repos(), [])
+        executor.assert_called_once_with(max_workers=1)
+
+    @patch('forklift.engine.head', side_effect=Timeout())
+    def test_validate_repo_timeout(self, head):
+        self.assertEqual(engine._validate_repo('owner/repo'), 'owner/repo: [Could not reach repository]')
+        self.assertEqual(head.call_args[1]['timeout'], engine.repo_timeout)
+
+        with self.assertRaises(Exception):
+            engine._validate_repo('owner/repo', raises=True)
+
 
 class TestListPallets(CleanUpAlternativeConfig):
 
@@ -181,6 +209,21 @@ class TestListPallets(CleanUpAlternativeConfig):
         except Exception as e:
             self.fail(e)
 
+    def test_get_pallets_in_file_same_file_name_in_different_folders(self):
+        #: a pallet file should not be given the classes of a same named file that was imported first
+        pallets_one, _ = engine._get_pallets_in_file(join(test_data_folder, 'same_name_pallets', 'one', 'same_name_pallet.py'))
+        pallets_two, _ = engine._get_pallets_in_file(join(test_data_folder, 'same_name_pallets', 'two', 'same_name_pallet.py'))
+
+        self.assertEqual([info[1].__name__ for info in pallets_one], ['SameNamePalletOne'])
+        self.assertEqual([info[1].__name__ for info in pallets_two], ['SameNamePalletTwo'])
+
+    def test_get_pallets_in_file_removes_failed_import_from_modules(self):
+        pallets, import_error = engine._get_pallets_in_file(join(test_data_folder, 'import_error_pallet.py'))
+
+        self.assertEqual(pallets, [])
+        self.assertIn('this pallet fails to import', import_error)
+        self.assertNotIn('import_error_pallet', sys.modules)
+
     def test_handles_build_errors(self):
         pallets, _ = engine.build_pallets(join(test_data_folder, 'BuildErrorPallet.py'), None)
 
@@ -325,6 +368,27 @@ class TestGitUpdate(CleanUpAlternativeConfig):
         remote_mock.pull.assert_called_once()
         self.assertEqual(len(results), 0)
 
+    @patch('forklift.engine._clone_or_pull_repo', return_value=(None, None))
+    @patch('forklift.engine.ThreadPoolExecutor', wraps=ThreadPoolExecutor)
+    def test_git_update_caps_workers(self, executor, _clone_or_pull_repo_mock):
+        engine.init()
+        config.set_config_prop('repositories', ['owner/repo{}'.format(number) for number in range(12)], override=True)
+
+        engine.git_update()
+
+        executor.assert_called_once_with(max_workers=engine.max_git_workers)
+        self.assertEqual(_clone_or_pull_repo_mock.call_count, 12)
+
+    @patch('forklift.engine._clone_or_pull_repo', return_value=(None, None))
+    def test_git_update_skips_repos_with_the_same_folder(self, _clone_or_pull_repo_mock):
+        engine.init()
+        config.set_config_prop('repositories', ['one/pallets', {'host': 'gitlabs.com/', 'repo': 'two/pallets', 'token': 'secret'}], override=True)
+
+        errors = engine.git_update()
+
+        _clone_or_pull_repo_mock.assert_called_once_with('one/pallets')
+        self.assertEqual(errors, ['Git update error for two/pallets: one/pallets is already cloned into the pallets warehouse folder'])
+
 
 class TestPackingSlip(unittest.TestCase):
 
@@ -451,8 +515,8 @@ class TestShipData(CleanUpAlternativeConfig):
   }
 ]'''
 
-    @patch('forklift.engine.listdir', return_value=[])
-    def test_ship_exits_if_no_files_or_slip(self, listdir):
+    @patch('forklift.engine._survey_pickup_location', return_value=(0, False))
+    def test_ship_exits_if_no_files_or_slip(self, survey):
         shipped = engine.ship_data()
 
         self.assertFalse(shipped)
@@ -463,8 +527,8 @@ class TestShipData(CleanUpAlternativeConfig):
     @patch('forklift.engine._process_packing_slip')
     @patch('forklift.config.get_config_prop')
     @patch('forklift.lift.copy_data')
-    @patch('forklift.engine.listdir', return_value=[engine.packing_slip_file])
-    def test_ship_only_ships_if_only_slip_found(self, listdir, copy_data, config_prop, packing_slip, exists, socket, generate_mock):
+    @patch('forklift.engine._survey_pickup_location', return_value=(1, True))
+    def test_ship_only_ships_if_only_slip_found(self, survey, copy_data, config_prop, packing_slip, exists, socket, generate_mock):
 
         def mock_props(value):
             if value == 'servers':
@@ -487,8 +551,8 @@ class TestShipData(CleanUpAlternativeConfig):
     @patch('forklift.engine.exists', return_value=True)
     @patch('forklift.engine._process_packing_slip')
     @patch('forklift.lift.copy_data')
-    @patch('forklift.engine.listdir', return_value=[engine.packing_slip_file])
-    def test_post_process_if_success(self, listdir, copy_data, packing_slip, exists, generate_mock):
+    @patch('forklift.engine._survey_pickup_location', return_value=(1, True))
+    def test_post_process_if_success(self, survey, copy_data, packing_slip, exists, generate_mock):
         slip = {'success': True, 'requires_processing': True}
         pallet = Mock(slip=slip, total_processing_time=3)
         pallet.ship.return_value = None
@@ -505,8 +569,8 @@ class TestShipData(CleanUpAlternativeConfig):
     @patch('forklift.engine.exists', return_value=True)
     @patch('forklift.engine._process_packing_slip')
     @patch('forklift.lift.copy_data')
-    @patch('forklift.engine.listdir', return_value=[engine.packing_slip_file])
-    def test_post_process_if_not_success(self, listdir, copy_data, packing_slip, exists, generate_mock):
+    @patch('forklift.engine._survey_pickup_location', return_value=(1, True))
+    def test_post_process_if_not_success(self, survey, copy_data, packing_slip, exists, generate_mock):
         slip = {'success': False, 'requires_processing': True}
         pallet = Mock(slip=slip, total_processing_time=3)
         pallet.ship.return_value = None
@@ -519,6 +583,14 @@ class TestShipData(CleanUpAlternativeConfig):
         pallet.ship.assert_not_called()
         pallet.post_copy_process.assert_not_called()
 
+    def test_survey_pickup_location(self):
+        pickup_location = join(test_data_folder, 'test_engine')
+
+        self.assertEqual(engine._survey_pickup_location(pickup_location), (1, True))
+
+    def test_survey_pickup_location_missing_folder(self):
+        self.assertEqual(engine._survey_pickup_location(join(test_data_folder, 'does-not-exist')), (0, False))
+
 
 class TestGetAffectedServices(unittest.TestCase):
     def test_gets_list_of_services(self):